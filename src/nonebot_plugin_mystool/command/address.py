@@ -86,7 +86,7 @@ async def _(event: Union[GeneralPrivateMessageEvent], state: T_State, bbs_uid=Ar
 
 
 @address_matcher.got('address_id', prompt='请发送你要选择的地址ID')
-async def _(_: Union[GeneralPrivateMessageEvent], state: T_State, address_id=ArgStr()):
+async def _(event: Union[GeneralPrivateMessageEvent], state: T_State, address_id=ArgStr()):
     if address_id == "退出":
         await address_matcher.finish("🚪已成功退出")
 
@@ -95,7 +95,7 @@ async def _(_: Union[GeneralPrivateMessageEvent], state: T_State, address_id=Arg
     if address is not None:
         account: UserAccount = state["account"]
         account.address = address
-        PluginDataManager.write_plugin_data()
+        PluginDataManager.write_user(event.get_user_id())
         await address_matcher.finish(f"🎉已成功设置账户 {account.display_name} 的地址")
     else:
         await address_matcher.reject("⚠️您发送的地址ID与查询结果不匹配，请重新发送")
@@ -222,7 +222,7 @@ async def _(
             for plan in plans:
                 if plan.good.goods_id == good_id:
                     plans.discard(plan)
-                    PluginDataManager.write_plugin_data()
+                    PluginDataManager.write_user(event.get_user_id())
                     for i in range(plugin_config.preference.exchange_thread_count):
                         try:
                             scheduler.remove_job(job_id=f"exchange-plan-{hash(plan)}-{i}")
@@ -274,7 +274,7 @@ async def _(
             if not fp_status:
                 await matcher.send(
                     '⚠️从服务器获取device_fp失败！兑换时将在本地生成device_fp。你也可以尝试重新添加兑换计划。')
-        PluginDataManager.write_plugin_data()
+        PluginDataManager.write_user(event.get_user_id())
 
     # 初始化兑换任务
     finished.setdefault(plan, [])
@@ -401,7 +401,7 @@ def exchange_notice(event: JobExecutionEvent):
                         )
                     if len(finished[plan]) == plugin_config.preference.exchange_thread_count:
                         del plan
-                        PluginDataManager.write_plugin_data()
+                        PluginDataManager.write_user(user_id)
 
         else:
             plan = exchange_result.plan
@@ -442,7 +442,7 @@ def exchange_notice(event: JobExecutionEvent):
                     except KeyError:
                         pass
                     else:
-                        PluginDataManager.write_plugin_data()
+                        PluginDataManager.write_user(user_id)
 
 
 async def exchange_begin(plan: ExchangePlan):
@@ -479,7 +479,7 @@ async def _():
                 # 若商品不存在则删除
                 # 若重启时兑换超时则删除该兑换
                 user.exchange_plans.remove(plan)
-                PluginDataManager.write_plugin_data()
+                PluginDataManager.write_user(user_id)
                 continue
             else:
                 finished.setdefault(plan, [])
@@ -117,7 +117,7 @@ async def handle_first_receive(event: Union[GeneralMessageEvent]):
                 fp_status, account.device_fp = await get_device_fp(device_id)
                 if fp_status:
                     logger.success(f"用户 {bbs_uid} 成功获取 device_fp: {account.device_fp}")
-                PluginDataManager.write_plugin_data()
+                PluginDataManager.write_user(user_id)
 
                 if login_status:
                     # 3. 通过 GameToken 获取 stoken_v2
@@ -125,7 +125,7 @@ async def handle_first_receive(event: Union[GeneralMessageEvent]):
                     if login_status:
                         logger.success(f"用户 {bbs_uid} 成功获取 stoken_v2: {cookies.stoken_v2}")
                         account.cookies.update(cookies)
-                        PluginDataManager.write_plugin_data()
+                        PluginDataManager.write_user(user_id)
 
                         if account.cookies.stoken_v2:
                             # 5. 通过 stoken_v2 获取 ltoken
@@ -133,14 +133,14 @@ async def handle_first_receive(event: Union[GeneralMessageEvent]):
                             if login_status:
                                 logger.success(f"用户 {bbs_uid} 成功获取 ltoken: {cookies.ltoken}")
                                 account.cookies.update(cookies)
-                                PluginDataManager.write_plugin_data()
+                                PluginDataManager.write_user(user_id)
 
                             # 6.1. 通过 stoken_v2 获取 cookie_token
                             login_status, cookies = await get_cookie_token_by_stoken(account.cookies, device_id)
                             if login_status:
                                 logger.success(f"用户 {bbs_uid} 成功获取 cookie_token: {cookies.cookie_token}")
                                 account.cookies.update(cookies)
-                                PluginDataManager.write_plugin_data()
+                                PluginDataManager.write_user(user_id)
 
                                 logger.success(
                                     f"{plugin_config.preference.log_head}米游社账户 {bbs_uid} 绑定成功")
@@ -151,7 +151,7 @@ async def handle_first_receive(event: Union[GeneralMessageEvent]):
                             if login_status:
                                 logger.success(f"用户 {bbs_uid} 成功获取 cookie_token: {cookies.cookie_token}")
                                 account.cookies.update(cookies)
-                                PluginDataManager.write_plugin_data()
+                                PluginDataManager.write_user(user_id)
             else:
                 await get_cookie.finish("⚠️获取二维码扫描状态超时，请尝试重新登录")
 
@@ -375,7 +375,10 @@ async def perform_game_sign(
     # 如果全部登录失效，则关闭通知
     if len(failed_accounts) == len(user.accounts):
         user.enable_notice = False
-        PluginDataManager.write_plugin_data()
+        if user_id := PluginDataManager.find_user_id(user):
+            PluginDataManager.write_user(user_id)
+        else:
+            PluginDataManager.write_plugin_data()
 
 
 async def perform_bbs_sign(
@@ -527,7 +530,10 @@ async def perform_bbs_sign(
     # 如果全部登录失效，则关闭通知
     if len(failed_accounts) == len(user.accounts):
         user.enable_notice = False
-        PluginDataManager.write_plugin_data()
+        if user_id := PluginDataManager.find_user_id(user):
+            PluginDataManager.write_user(user_id)
+        else:
+            PluginDataManager.write_plugin_data()
 
 
 async def genshin_note_check(user: UserData, user_ids: Iterable[str], matcher: Matcher = None):
@@ -124,11 +124,11 @@ async def _(event: Union[GeneralMessageEvent], state: T_State, setting_id=ArgStr
         await account_setting.finish('🚪已成功退出')
     elif setting_id == '1':
         account.enable_mission = not account.enable_mission
-        PluginDataManager.write_plugin_data()
+        PluginDataManager.write_user(event.get_user_id())
         await account_setting.finish(f"📅米游币任务自动执行已 {'✅开启' if account.enable_mission else '❌关闭'}")
     elif setting_id == '2':
         account.enable_game_sign = not account.enable_game_sign
-        PluginDataManager.write_plugin_data()
+        PluginDataManager.write_user(event.get_user_id())
         await account_setting.finish(f"📅米哈游游戏自动签到已 {'✅开启' if account.enable_game_sign else '❌关闭'}")
     elif setting_id == '3':
         signable_games = "、".join(f"『{game.name}』" for game in BaseGameSign.available_game_signs)
@@ -147,7 +147,7 @@ async def _(event: Union[GeneralMessageEvent], state: T_State, setting_id=ArgStr
         else:
             account.platform = "ios"
             platform_show = "iOS"
-        PluginDataManager.write_plugin_data()
+        PluginDataManager.write_user(event.get_user_id())
         await account_setting.finish(f"📲设备平台已更改为 {platform_show}")
     elif setting_id == '5':
         games_show = "、".join(map(lambda x: f"『{x.name}』", BaseMission.available_games.values()))
@@ -161,7 +161,7 @@ async def _(event: Union[GeneralMessageEvent], state: T_State, setting_id=ArgStr
         state["setting_item"] = "mission_games"
     elif setting_id == '6':
         account.enable_resin = not account.enable_resin
-        PluginDataManager.write_plugin_data()
+        PluginDataManager.write_user(event.get_user_id())
         await account_setting.finish(f"📅原神、星穹铁道便笺提醒已 {'✅开启' if account.enable_resin else '❌关闭'}")
     elif setting_id == '7':
         await account_setting.send(
@@ -177,7 +177,7 @@ async def _(event: Union[GeneralMessageEvent], state: T_State, setting_id=ArgStr
         await account_setting.reject(f"⚠️确认删除账号 {account.display_name} ？发送 \"确认删除\" 以确定。")
     elif setting_id == '确认删除' and state["prepare_to_delete"]:
         user_account.pop(account.bbs_uid)
-        PluginDataManager.write_plugin_data()
+        PluginDataManager.write_user(event.get_user_id())
         await account_setting.finish(f"已删除账号 {account.display_name} 的数据")
     else:
         await account_setting.reject("⚠️您的输入有误，请重新输入")
@@ -208,7 +208,7 @@ async def _(_: Union[GeneralMessageEvent], state: T_State, notice_game=ArgStr())
 
 
 @account_setting.got('setting_value')
-async def _(_: Union[GeneralMessageEvent], state: T_State, setting_value=ArgStr()):
+async def _(event: Union[GeneralMessageEvent], state: T_State, setting_value=ArgStr()):
     if setting_value == '退出':
         await account_setting.finish('🚪已成功退出')
     account: UserAccount = state['account']
@@ -222,7 +222,7 @@ async def _(_: Union[GeneralMessageEvent], state: T_State, setting_value=ArgStr(
             if 0 <= resin_threshold <= 200:
                 # 输入有效的数字范围，将 resin_threshold 赋值为输入的整数
                 account.user_resin_threshold = resin_threshold
-                PluginDataManager.write_plugin_data()
+                PluginDataManager.write_user(event.get_user_id())
                 await account_setting.finish("更改原神便笺树脂提醒阈值成功\n"
                                              f"⏰当前提醒阈值：{resin_threshold}")
             else:
@@ -237,7 +237,7 @@ async def _(_: Union[GeneralMessageEvent], state: T_State, setting_value=ArgStr(
             if 0 <= stamina_threshold <= 240:
                 # 输入有效的数字范围，将 stamina_threshold 赋值为输入的整数
                 account.user_stamina_threshold = stamina_threshold
-                PluginDataManager.write_plugin_data()
+                PluginDataManager.write_user(event.get_user_id())
                 await account_setting.finish("更改崩铁便笺开拓力提醒阈值成功\n"
                                              f"⏰当前提醒阈值：{stamina_threshold}")
             else:
@@ -256,7 +256,7 @@ async def _(_: Union[GeneralMessageEvent], state: T_State, setting_value=ArgStr(
                 sign_games.append(game_name)
 
         account.game_sign_games = sign_games
-        PluginDataManager.write_plugin_data()
+        PluginDataManager.write_user(event.get_user_id())
         setting_value = setting_value.replace(" ", "、")
         await account_setting.finish(f"💬执行签到的游戏已更改为『{setting_value}』")
 
@@ -273,7 +273,7 @@ async def _(_: Union[GeneralMessageEvent], state: T_State, setting_value=ArgStr(
                 mission_games.append(game_name)
 
         account.mission_games = mission_games
-        PluginDataManager.write_plugin_data()
+        PluginDataManager.write_user(event.get_user_id())
         setting_value = setting_value.replace(" ", "、")
         await account_setting.finish(f"💬执行米游币任务的频道已更改为『{setting_value}』")
 
@@ -310,7 +310,7 @@ async def _(event: Union[GeneralMessageEvent], matcher: Matcher, choice=ArgStr()
         await matcher.finish("🚪已成功退出")
     elif choice == '是':
         user.enable_notice = not user.enable_notice
-        PluginDataManager.write_plugin_data()
+        PluginDataManager.write_user(event.get_user_id())
         await matcher.finish(f"自动通知每日计划任务结果 已 {'🔔开启' if user.enable_notice else '🔕关闭'}")
     elif choice == '否':
         await matcher.finish("没有做修改哦~")
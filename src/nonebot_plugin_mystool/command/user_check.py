@@ -224,7 +224,7 @@ async def _(bot: Bot, event: Union[GeneralGroupMessageEvent]):
         user_id = event.get_user_id()
         if user := PluginDataManager.plugin_data.users.get(user_id):
             user.qq_guild[user_id] = event.guild_id
-            PluginDataManager.write_plugin_data()
+            PluginDataManager.write_user(user_id)
 
     msg_text = f"{PLUGIN.metadata.name}" \
                f"{PLUGIN.metadata.description}\n" \
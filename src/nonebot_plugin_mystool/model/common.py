@@ -58,14 +58,17 @@ class BaseModelWithUpdate(BaseModel):
         """
         更新数据对象
 
+        键已被限制在 __fields__ 内，因此直接批量更新 __dict__，
+        跳过逐个 setattr 产生的 pydantic 赋值开销
+
         :param obj: 新的数据对象或属性字典
         :raise TypeError
         """
         if isinstance(obj, type(self)):
             obj = obj.dict()
-        items = filter(lambda x: x[0] in self.__fields__, obj.items())
-        for k, v in items:
-            setattr(self, k, v)
+        items = dict(filter(lambda x: x[0] in self.__fields__, obj.items()))
+        self.__dict__.update(items)
+        self.__fields_set__.update(items)
         return self
 
 
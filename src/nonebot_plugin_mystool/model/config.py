@@ -1,19 +1,22 @@
+import dataclasses
 import os
+import stat
 import sys
 from datetime import time, timedelta, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Union, Optional, Tuple, Any, Dict, TYPE_CHECKING
 
 import nonebot
 from nonebot.log import logger
-from pydantic import BaseModel, BaseSettings, validator
+from pydantic import BaseModel, BaseSettings, Field, validator
 
 from ..model.common import data_path
 
 if TYPE_CHECKING:
     IntStr = Union[int, str]
 
-__all__ = ["plugin_config_path", "Preference",
+__all__ = ["plugin_config_path", "GEETEST_JSON_DEFAULT", "Preference", "make_frozen_preference",
            "GoodListImageConfig", "SaltConfig", "DeviceConfig", "PluginConfig", "PluginEnv", "plugin_config",
            "plugin_env"]
 
@@ -21,6 +24,34 @@ plugin_config_path = data_path / "configV2.json"
 """插件数据文件默认路径"""
 _driver = nonebot.get_driver()
 
+GEETEST_JSON_DEFAULT: Dict[str, Any] = {
+    "gt": "{gt}",
+    "challenge": "{challenge}"
+}
+"""极验Geetest人机验证打码API发送的JSON数据默认模板"""
+
+
+@lru_cache(maxsize=None)
+def _check_log_path(absolute_path: Path):
+    """
+    检查日志路径是否可写，必要时创建日志目录；每个路径只检查一次，
+    避免每次构造 Preference 时重复 stat 探测
+
+    :param absolute_path: 日志文件的绝对路径
+    """
+    try:
+        path_stat = os.stat(absolute_path)
+    except OSError:
+        # 文件不存在或无法访问，尝试创建日志目录
+        absolute_parent = absolute_path.parent
+        try:
+            os.makedirs(absolute_parent, exist_ok=True)
+        except PermissionError:
+            logger.warning(f"程序没有创建日志目录 {absolute_parent} 的权限")
+    else:
+        if stat.S_ISREG(path_stat.st_mode) and not os.access(absolute_path, os.W_OK):
+            logger.warning(f"程序没有写入日志文件 {absolute_path} 的权限")
+
 
 class Preference(BaseModel):
     """
@@ -50,7 +81,7 @@ class Preference(BaseModel):
     """是否保存日志"""
     log_head: str = ""
     '''日志开头字符串(只有把插件放进plugins目录手动加载时才需要设置)'''
-    log_path: Optional[Path] = data_path / "mystool.log"
+    log_path: Optional[Path] = Field(default_factory=lambda: data_path / "mystool.log")
     """日志保存路径"""
     log_rotation: Union[str, int, time, timedelta] = "1 week"
     '''日志保留时长(需要按照格式设置)'''
@@ -78,24 +109,23 @@ class Preference(BaseModel):
     '''极验Geetest人机验证打码接口URL'''
     geetest_params: Optional[Dict[str, Any]] = None
     '''极验Geetest人机验证打码API发送的参数（除gt，challenge外）'''
-    geetest_json: Optional[Dict[str, Any]] = {
-        "gt": "{gt}",
-        "challenge": "{challenge}"
-    }
+    geetest_json: Optional[Dict[str, Any]] = Field(default_factory=GEETEST_JSON_DEFAULT.copy)
     '''极验Geetest人机验证打码API发送的JSON数据 `{gt}`, `{challenge}` 为占位符'''
     override_device_and_salt: bool = False
     """是否读取插件数据文件中的 device_config 设备配置 和 salt_config 配置而不是默认配置（一般情况不建议开启）"""
+    trusted_fast_load: bool = True
+    """加载插件数据文件时是否信任文件内容并跳过完整校验（文件结构异常时会自动回退至完整校验）"""
     enable_blacklist: bool = False
     """是否启用用户黑名单"""
-    blacklist_path: Optional[Path] = data_path / "blacklist.txt"
+    blacklist_path: Optional[Path] = Field(default_factory=lambda: data_path / "blacklist.txt")
     """用户黑名单文件路径"""
     enable_whitelist: bool = False
     """是否启用用户白名单"""
-    whitelist_path: Optional[Path] = data_path / "whitelist.txt"
+    whitelist_path: Optional[Path] = Field(default_factory=lambda: data_path / "whitelist.txt")
     """用户白名单文件路径"""
     enable_admin_list: bool = False
     """是否启用管理员名单"""
-    admin_list_path: Optional[Path] = data_path / "admin_list.txt"
+    admin_list_path: Optional[Path] = Field(default_factory=lambda: data_path / "admin_list.txt")
     """管理员名单文件路径"""
     game_token_app_id: str = "2"
     """米游社二维码登录的应用标识符"""
@@ -106,17 +136,13 @@ class Preference(BaseModel):
 
     @validator("log_path", allow_reuse=True)
     def _(cls, v: Optional[Path]):
-        absolute_path = v.absolute()
-        if not os.path.exists(absolute_path) or not os.path.isfile(absolute_path):
-            absolute_parent = absolute_path.parent
-            try:
-                os.makedirs(absolute_parent, exist_ok=True)
-            except PermissionError:
-                logger.warning(f"程序没有创建日志目录 {absolute_parent} 的权限")
-        elif not os.access(absolute_path, os.W_OK):
-            logger.warning(f"程序没有写入日志文件 {absolute_path} 的权限")
+        _check_log_path(v.absolute())
         return v
 
+    class Config:
+        # 校验时不复制已构造的模型实例，避免每次加载产生多余的拷贝
+        copy_on_model_validation = 'none'
+
     @property
     def notice_time(self) -> bool:
         now_hour = datetime.now().hour
@@ -128,6 +154,26 @@ class Preference(BaseModel):
         return start_time <= (now_hour * 60 + now_minute) % (24 * 60) <= end_time
 
 
+_FrozenPreference = dataclasses.make_dataclass(
+    "FrozenPreference",
+    list(Preference.__fields__),
+    frozen=True,
+    eq=False
+)
+"""偏好设置的不可变快照类型，字段与 Preference 一致"""
+
+
+def make_frozen_preference(preference: Preference) -> Any:
+    """
+    生成偏好设置的不可变快照（frozen dataclass），所有字段值在创建时固化。
+    适用于只需读取属性的热路径，属性访问不再经过 pydantic 模型
+
+    :param preference: 要固化的偏好设置
+    :return: FrozenPreference 对象
+    """
+    return _FrozenPreference(**{name: getattr(preference, name) for name in Preference.__fields__})
+
+
 class GoodListImageConfig(BaseModel):
     """
     商品列表输出图片设置
@@ -173,7 +219,7 @@ class SaltConfig(BaseModel):
     '''PROD - 账号相关'''
 
     class Config(Preference.Config):
-        pass
+        allow_mutation = False
 
 
 class DeviceConfig(BaseModel):
@@ -232,25 +278,45 @@ class DeviceConfig(BaseModel):
     '''Headers所用的 sec-ch-ua-platform'''
 
     class Config(Preference.Config):
-        pass
+        allow_mutation = False
+
+
+def _config_fingerprint(config: BaseModel) -> int:
+    """
+    计算配置模型的指纹（字段值排序元组的哈希），
+    与默认配置比较时只需比较一个整数而非逐字段比较
+
+    :param config: 配置模型对象
+    """
+    return hash(tuple(sorted(config.dict().items())))
+
+
+_DEFAULT_SALT_CONFIG = SaltConfig()
+"""默认 salt 配置单例，避免重复构造"""
+_DEFAULT_DEVICE_CONFIG = DeviceConfig()
+"""默认设备信息配置单例，避免重复构造"""
+_DEFAULT_SALT_CONFIG_FINGERPRINT = _config_fingerprint(_DEFAULT_SALT_CONFIG)
+"""默认 salt 配置的指纹"""
+_DEFAULT_DEVICE_CONFIG_FINGERPRINT = _config_fingerprint(_DEFAULT_DEVICE_CONFIG)
+"""默认设备信息配置的指纹"""
 
 
 class PluginConfig(BaseSettings):
-    preference = Preference()
-    good_list_image_config = GoodListImageConfig()
+    preference: Preference = Field(default_factory=Preference)
+    good_list_image_config: GoodListImageConfig = Field(default_factory=GoodListImageConfig)
 
 
 class PluginEnv(BaseSettings):
-    salt_config = SaltConfig()
-    device_config = DeviceConfig()
+    salt_config = _DEFAULT_SALT_CONFIG
+    device_config = _DEFAULT_DEVICE_CONFIG
 
     class Config(BaseSettings.Config):
         env_prefix = "mystool_"
         env_file = '.env'
 
 
-if plugin_config_path.exists() and plugin_config_path.is_file():
-    plugin_config = PluginConfig.parse_file(plugin_config_path)
+if plugin_config_path.is_file():
+    plugin_config = PluginConfig.parse_raw(plugin_config_path.read_bytes())
 else:
     plugin_config = PluginConfig()
     try:
@@ -273,3 +339,7 @@ else:
 
 
 plugin_env = PluginEnv()
+
+if _config_fingerprint(plugin_env.salt_config) != _DEFAULT_SALT_CONFIG_FINGERPRINT \
+        or _config_fingerprint(plugin_env.device_config) != _DEFAULT_DEVICE_CONFIG_FINGERPRINT:
+    logger.info("检测到通过环境变量自定义的 salt_config / device_config 配置")
@@ -1,15 +1,25 @@
+import asyncio
 import json
+import os
 from json import JSONDecodeError
+from pathlib import Path
 from typing import Union, Optional, Any, Dict, TYPE_CHECKING, AbstractSet, \
-    Mapping, Set, Literal, List
+    Mapping, Set, Literal, List, Tuple
 from uuid import UUID, uuid4
 
+import nonebot
 from httpx import Cookies
 from nonebot.log import logger
 from pydantic import BaseModel, ValidationError, validator, Field
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .._version import __version__
 from ..model.common import data_path, BaseModelWithSetter, Address, BaseModelWithUpdate, Good, GameRecord
+from ..model.config import plugin_config
 
 if TYPE_CHECKING:
     IntStr = Union[int, str]
@@ -17,10 +27,42 @@ if TYPE_CHECKING:
     AbstractSetIntStr = AbstractSet[IntStr]
     MappingIntStrAny = Mapping[IntStr, Any]
 
-__all__ = ["plugin_data_path", "BBSCookies", "UserAccount", "ExchangePlan", "ExchangeResult", "uuid4_validate",
-           "UserData", "PluginData", "PluginDataManager"]
+__all__ = ["plugin_data_path", "users_data_path", "BBSCookies", "UserAccount", "ExchangePlan", "ExchangeResult",
+           "uuid4_validate", "UserData", "PluginData", "PluginDataManager"]
 
 plugin_data_path = data_path / "dataV2.json"
+users_data_path = data_path / "users"
+"""每个用户一个JSON文件的用户数据目录，写入时只需序列化被修改的用户"""
+_IO_BUFFER_SIZE = 64 * 1024
+"""插件数据文件读写所用的缓冲区大小"""
+
+if orjson is not None:
+    def _json_dumps(v, *, default=None, indent: Optional[int] = None) -> str:
+        """orjson 实现的 JSON 序列化，接口与 json.dumps 兼容（仅支持 indent=2 风格的缩进）"""
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(v, default=default, option=option).decode()
+
+    _json_loads = orjson.loads
+else:
+    def _json_dumps(v, *, default=None, indent: Optional[int] = None) -> str:
+        return json.dumps(v, default=default, indent=indent)
+
+    _json_loads = json.loads
+
+
+def _atomic_write(path: Path, str_data: str):
+    """
+    先写入临时文件再原子替换目标文件，避免写入中断导致数据文件损坏
+
+    :param path: 目标文件路径
+    :param str_data: 待写入的字符串数据
+    """
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(temp_path, "wb", buffering=_IO_BUFFER_SIZE) as f:
+        f.write(str_data.encode("utf-8"))
+    os.replace(temp_path, path)
+
+
 _uuid_set: Set[str] = set()
 """已使用的用户UUID密钥集合"""
 _new_uuid_in_init = False
@@ -207,6 +249,10 @@ class BBSCookies(BaseModelWithSetter, BaseModelWithUpdate):
 
         return cookies_dict
 
+    class Config:
+        # 校验时不复制已构造的模型实例，避免每次加载产生多余的拷贝
+        copy_on_model_validation = 'none'
+
 
 class UserAccount(BaseModelWithSetter):
     """
@@ -287,6 +333,9 @@ class UserAccount(BaseModelWithSetter):
         from ..utils.common import blur_phone
         return f"{self.bbs_uid}({blur_phone(self.phone_number)})" if self.phone_number else self.bbs_uid
 
+    class Config:
+        copy_on_model_validation = 'none'
+
 
 class ExchangePlan(BaseModel):
     """
@@ -426,6 +475,11 @@ class UserData(BaseModelWithSetter):
     def __hash__(self):
         return hash(self.uuid)
 
+    class Config:
+        copy_on_model_validation = 'none'
+        json_loads = _json_loads
+        json_dumps = _json_dumps
+
 
 class PluginData(BaseModel):
     version: str = __version__
@@ -464,28 +518,147 @@ class PluginData(BaseModel):
         self.do_user_bind(write=True)
 
     class Config:
-        json_encoders = UserAccount.Config.json_encoders
+        copy_on_model_validation = 'none'
+        json_encoders = UserAccount.__config__.json_encoders
+        json_loads = _json_loads
+        json_dumps = _json_dumps
+
+
+class _PluginDataManagerMeta(type):
+    """
+    使 PluginDataManager.plugin_data 在首次被访问时才加载插件数据文件，
+    从而让模块导入本身没有读写文件的副作用
+    """
+
+    def __getattr__(cls, name: str):
+        if name == "plugin_data" and not cls._loading:
+            cls.load_plugin_data()
+            return cls.__dict__["plugin_data"]
+        raise AttributeError(name)
+
+
+class PluginDataManager(metaclass=_PluginDataManagerMeta):
+    plugin_data: Optional[PluginData]
+    """加载出的插件数据对象（首次访问时自动加载）"""
+    _loading: bool = False
+    """是否正在加载插件数据文件"""
+    _dirty: bool = False
+    """插件数据是否有待写入文件的改动（包括全部用户数据）"""
+    _dirty_users: Set[str] = set()
+    """有待写入文件改动的用户ID集合"""
+    _flush_task: Optional["asyncio.Task"] = None
+    """后台刷写任务"""
+    _FLUSH_INTERVAL: float = 3
+    """后台刷写任务检查待写入改动的间隔（单位：秒）"""
+    _unique_users_cache: Optional[List[Tuple[str, UserData]]] = None
+    """不含绑定别名的 (用户ID, 用户数据) 列表缓存，数据被标记改动时失效"""
+
+    @classmethod
+    def _trusted_load_user(cls, user_dict: Dict[str, Any]) -> UserData:
+        """
+        以信任模式加载单个用户数据，使用 construct 跳过 pydantic 校验
+
+        :param user_dict: 用户数据反序列化出的字典
+        :raise KeyError, AttributeError, TypeError: 数据结构与预期不符，需要回退至完整校验
+        """
+        if not user_dict.get("uuid"):
+            # 缺少UUID密钥的旧数据需要走完整校验以生成UUID
+            raise KeyError("uuid")
+        accounts: Dict[str, UserAccount] = {}
+        for bbs_uid, account_dict in (user_dict.get("accounts") or {}).items():
+            account_fields = dict(account_dict)
+            account_fields["cookies"] = BBSCookies.construct(**account_dict["cookies"])
+            if account_dict.get("address"):
+                account_fields["address"] = Address.construct(**account_dict["address"])
+            accounts[bbs_uid] = UserAccount.construct(**account_fields)
+        user_fields = dict(user_dict)
+        user_fields["accounts"] = accounts
+        # 兑换计划结构复杂且数量较少，仍走完整校验
+        user_fields["exchange_plans"] = set(
+            map(ExchangePlan.parse_obj, user_dict.get("exchange_plans") or [])
+        )
+        if not user_fields.get("qq_guild") and any(user_fields.get("qq_guilds") or {}):
+            # 旧版 qq_guilds 数据需要走完整校验以完成迁移
+            raise KeyError("qq_guild")
+        user = UserData.construct(**user_fields)
+        _uuid_set.add(user.uuid)
+        return user
 
+    @classmethod
+    def _trusted_load(cls, plugin_data_dict: Dict[str, Any]) -> PluginData:
+        """
+        以信任模式加载插件数据，使用 construct 跳过 pydantic 校验。
+        数据文件由本插件自己写出，正常情况下无需重新校验每个字段。
+
+        :param plugin_data_dict: 插件数据文件反序列化出的字典
+        :raise KeyError, AttributeError, TypeError: 数据结构与预期不符，需要回退至完整校验
+        """
+        users: Dict[str, UserData] = {}
+        for user_id, user_dict in (plugin_data_dict.get("users") or {}).items():
+            users[user_id] = cls._trusted_load_user(user_dict)
+
+        plugin_data = PluginData.construct(
+            version=plugin_data_dict["version"],
+            user_bind=plugin_data_dict.get("user_bind") or {},
+            users=users
+        )
+        # construct 跳过了 __init__，需要手动执行用户数据绑定同步
+        plugin_data.do_user_bind()
+        return plugin_data
+
+    @classmethod
+    def _reuse_loaded_users(cls, previous_users: Dict[str, UserData]):
+        """
+        重新加载时复用上一次加载出的 UserData 对象：相同用户ID的旧对象原地更新字段后继续使用，
+        避免整批用户对象的重新分配，外部持有的旧对象引用也会自动看到新数据
 
-class PluginDataManager:
-    plugin_data: Optional[PluginData] = None
-    """加载出的插件数据对象"""
+        :param previous_users: 上一次加载出的用户数据字典
+        """
+        for user_id, new_user in cls.plugin_data.users.items():
+            old_user = previous_users.get(user_id)
+            if old_user is not None and old_user is not new_user:
+                old_user.__dict__.update(new_user.__dict__)
+                old_user.__fields_set__.update(new_user.__fields_set__)
+                cls.plugin_data.users[user_id] = old_user
+        # 换回旧对象后需要重新同步用户数据绑定的对象别名关系
+        cls.plugin_data.do_user_bind()
 
     @classmethod
     def load_plugin_data(cls):
         """
         加载插件数据文件
         """
-        if plugin_data_path.exists() and plugin_data_path.is_file():
+        cls._loading = True
+        try:
+            cls._do_load_plugin_data()
+        finally:
+            cls._loading = False
+
+    @classmethod
+    def _do_load_plugin_data(cls):
+        """
+        加载插件数据文件的实际逻辑
+        """
+        global _new_uuid_in_init
+        loaded_plugin_data = cls.__dict__.get("plugin_data")
+        previous_users = loaded_plugin_data.users if loaded_plugin_data is not None else None
+        if plugin_data_path.is_file():
             try:
-                with open(plugin_data_path, "r") as f:
-                    plugin_data_dict = json.load(f)
+                with open(plugin_data_path, "rb", buffering=_IO_BUFFER_SIZE) as f:
+                    plugin_data_dict = _json_loads(f.read())
                 # 读取完整的插件数据
-                cls.plugin_data = PluginData.parse_obj(plugin_data_dict)
+                if plugin_config.preference.trusted_fast_load:
+                    try:
+                        cls.plugin_data = cls._trusted_load(plugin_data_dict)
+                    except (KeyError, AttributeError, TypeError):
+                        logger.warning("信任模式加载插件数据失败，回退至完整校验加载")
+                        cls.plugin_data = PluginData.parse_obj(plugin_data_dict)
+                else:
+                    cls.plugin_data = PluginData.parse_obj(plugin_data_dict)
             except (ValidationError, JSONDecodeError):
                 logger.exception(f"读取插件数据文件失败，请检查插件数据文件 {plugin_data_path} 格式是否正确")
                 raise
-            except Exception:
+            except (OSError, KeyError):
                 logger.exception(
                     f"读取插件数据文件失败，请检查插件数据文件 {plugin_data_path} 是否存在且有权限读取和写入")
                 raise
@@ -494,34 +667,233 @@ class PluginDataManager:
             try:
                 str_data = cls.plugin_data.json(indent=4)
                 plugin_data_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(plugin_data_path, "w", encoding="utf-8") as f:
-                    f.write(str_data)
+                _atomic_write(plugin_data_path, str_data)
             except (AttributeError, TypeError, ValueError, PermissionError):
                 logger.exception(f"创建插件数据文件失败，请检查是否有权限读取和写入 {plugin_data_path}")
                 raise
             else:
                 logger.info(f"插件数据文件 {plugin_data_path} 不存在，已创建默认插件数据文件。")
 
+        cls._load_user_files()
+        if previous_users:
+            cls._reuse_loaded_users(previous_users)
+        cls._unique_users_cache = None
+
+        # 如果插件数据加载后，发现有用户没有UUID密钥，进行了生成，则需要保存写入
+        if _new_uuid_in_init:
+            _new_uuid_in_init = False
+            cls.write_plugin_data()
+
+    @classmethod
+    def _load_user_files(cls):
+        """
+        从 users 目录加载各用户数据文件，覆盖主数据文件中的同名用户数据
+        """
+        if not users_data_path.is_dir():
+            return
+        for path in sorted(users_data_path.glob("*.json")):
+            try:
+                user_dict = _json_loads(path.read_bytes())
+                if plugin_config.preference.trusted_fast_load:
+                    try:
+                        user = cls._trusted_load_user(user_dict)
+                    except (KeyError, AttributeError, TypeError):
+                        logger.warning(f"信任模式加载用户数据文件 {path} 失败，回退至完整校验加载")
+                        user = UserData.parse_obj(user_dict)
+                else:
+                    user = UserData.parse_obj(user_dict)
+            except (ValidationError, JSONDecodeError):
+                logger.exception(f"读取用户数据文件失败，请检查用户数据文件 {path} 格式是否正确")
+                raise
+            else:
+                cls.plugin_data.users[path.stem] = user
+        # 用户数据绑定可能指向刚加载的用户数据对象，需要重新同步
+        cls.plugin_data.do_user_bind()
+
     @classmethod
-    def write_plugin_data(cls):
+    def get_unique_users(cls) -> List[Tuple[str, UserData]]:
+        """
+        获取 不包含绑定用户数据 的所有用户数据以及对应的ID列表（带缓存），即不会出现值重复项。
+        批量遍历用户（如定时签到、便笺检查）时无需每次重新过滤用户字典
+
+        :return: [(用户ID, 用户数据)]
+        """
+        if cls._unique_users_cache is None:
+            cls._unique_users_cache = [
+                (user_id, user) for user_id, user in cls.plugin_data.users.items()
+                if user_id not in cls.plugin_data.user_bind
+            ]
+        return cls._unique_users_cache
+
+    @classmethod
+    def find_user_id(cls, user: UserData) -> Optional[str]:
+        """
+        查找用户数据对象对应的用户ID
+
+        :param user: 用户数据对象
+        :return: 用户ID，用户数据对象不在用户字典中时返回 None
+        """
+        return next((x for x, y in cls.plugin_data.users.items() if y is user), None)
+
+    @classmethod
+    def _bound_user_ids(cls, user_id: str) -> Set[str]:
+        """
+        获取与指定用户共享同一用户数据对象的所有用户ID（含自身）
+
+        由于用户数据绑定功能，多个用户ID可能指向同一个用户数据对象，
+        单用户写入时需要一并写入这些用户的数据文件，防止重载时旧文件覆盖新数据
+
+        :param user_id: 用户ID
+        :return: 用户ID集合
+        """
+        target = cls.plugin_data.user_bind.get(user_id, user_id)
+        user_ids = {user_id, target}
+        user_ids.update(x for x, y in cls.plugin_data.user_bind.items() if y == target)
+        return user_ids
+
+    @classmethod
+    def mark_dirty(cls, user_id: Optional[str] = None):
+        """
+        标记插件数据有待写入文件的改动，由后台刷写任务合并写入
+
+        :param user_id: 仅某个用户的数据有改动时传入其用户ID，否则标记全部数据待写入
+        """
+        cls._unique_users_cache = None
+        if user_id is None:
+            cls._dirty = True
+        else:
+            cls._dirty_users.update(cls._bound_user_ids(user_id))
+
+    @classmethod
+    def write_plugin_data(cls, force: bool = False, pretty: bool = False):
         """
         写入插件数据文件
 
+        默认情况下仅标记数据为待写入，由后台刷写任务合并写入文件，
+        避免连续的用户数据更新反复序列化整个插件数据；
+        后台任务尚未启动（如插件仍在加载）或 force=True 时立即写入。
+
+        :param force: 是否立即写入
+        :param pretty: 是否以带缩进的格式立即写入（用于人工查看数据文件，日常写入为紧凑格式）
+        :return: 是否成功
+        """
+        cls._unique_users_cache = None
+        if not force and not pretty and cls._flush_task is not None:
+            cls.mark_dirty()
+            return True
+        return cls._write_plugin_data_file(pretty=pretty)
+
+    @classmethod
+    def write_user(cls, user_id: str, force: bool = False, pretty: bool = False):
+        """
+        写入单个用户的数据文件（与其绑定的用户数据文件会一并写入）
+
+        :param user_id: 用户ID
+        :param force: 是否立即写入
+        :param pretty: 是否以带缩进的格式立即写入
+        :return: 是否成功
+        """
+        cls._unique_users_cache = None
+        if not force and not pretty and cls._flush_task is not None:
+            cls.mark_dirty(user_id)
+            return True
+        return cls._write_user_files(cls._bound_user_ids(user_id), pretty=pretty)
+
+    @classmethod
+    def _write_user_files(cls, user_ids: Set[str], pretty: bool = False):
+        """
+        将指定用户的数据写入 users 目录下对应的文件，用户已不存在时删除对应文件
+
+        :param user_ids: 用户ID集合
+        :param pretty: 是否以带缩进的格式写入
+        :return: 是否成功
+        """
+        success = True
+        indent = 4 if pretty else None
+        users_data_path.mkdir(parents=True, exist_ok=True)
+        for user_id in user_ids:
+            user = cls.plugin_data.users.get(user_id)
+            user_path = users_data_path / f"{user_id}.json"
+            if user is None:
+                user_path.unlink(missing_ok=True)
+                continue
+            try:
+                str_data = user.json(indent=indent)
+            except (AttributeError, TypeError, ValueError):
+                logger.exception(f"用户数据 {user_id} 序列化失败，可能是数据类型错误")
+                success = False
+            else:
+                _atomic_write(user_path, str_data)
+        return success
+
+    @classmethod
+    def _write_plugin_data_file(cls, pretty: bool = False):
+        """
+        序列化插件数据并写入文件：主数据文件只保存小体积的配置数据，
+        各用户数据分别写入 users 目录下的单独文件
+
+        JSON 解析与缩进无关，日常写入使用紧凑格式以减少序列化耗时和写入字节数
+
+        :param pretty: 是否以带缩进的格式写入
         :return: 是否成功
         """
         try:
-            str_data = cls.plugin_data.json(indent=4)
+            str_data = cls.plugin_data.json(indent=4 if pretty else None, exclude={"users"})
         except (AttributeError, TypeError, ValueError):
             logger.exception("数据对象序列化失败，可能是数据类型错误")
             return False
-        else:
-            with open(plugin_data_path, "w", encoding="utf-8") as f:
-                f.write(str_data)
-            return True
+        _atomic_write(plugin_data_path, str_data)
+        success = cls._write_user_files(set(cls.plugin_data.users), pretty=pretty)
+        # 清理已被删除用户的残留数据文件
+        for path in users_data_path.glob("*.json"):
+            if path.stem not in cls.plugin_data.users:
+                path.unlink(missing_ok=True)
+        if success:
+            # 写入成功后才清除待写入标记，失败时保留改动以便重试
+            cls._dirty = False
+            cls._dirty_users.clear()
+        return success
+
+    @classmethod
+    async def _flush_plugin_data(cls):
+        """
+        后台任务：周期性将标记为待写入的插件数据写入文件。
+        写入失败时保留待写入标记并记录日志，在下一周期重试，任务本身不会退出
+        """
+        while True:
+            await asyncio.sleep(cls._FLUSH_INTERVAL)
+            dirty_users: Optional[Set[str]] = None
+            try:
+                if cls._dirty:
+                    cls._write_plugin_data_file()
+                elif cls._dirty_users:
+                    dirty_users, cls._dirty_users = cls._dirty_users, set()
+                    if not cls._write_user_files(dirty_users):
+                        cls._dirty_users |= dirty_users
+            except Exception:
+                logger.exception("后台写入插件数据失败，将在下一周期重试")
+                if dirty_users:
+                    cls._dirty_users |= dirty_users
+
+
+_driver = nonebot.get_driver()
+
 
+@_driver.on_startup
+async def _start_flush_task():
+    """启动时加载插件数据并启动后台刷写任务"""
+    # 主动加载一次插件数据，数据文件损坏时在启动阶段即报错，而不是首次使用时才失败
+    if PluginDataManager.__dict__.get("plugin_data") is None:
+        PluginDataManager.load_plugin_data()
+    if PluginDataManager._flush_task is None:
+        PluginDataManager._flush_task = asyncio.create_task(PluginDataManager._flush_plugin_data())
 
-PluginDataManager.load_plugin_data()
 
-# 如果插件数据文件加载后，发现有用户没有UUID密钥，进行了生成，则需要保存写入
-if _new_uuid_in_init:
-    PluginDataManager.write_plugin_data()
+@_driver.on_shutdown
+async def _stop_flush_task():
+    """停止后台刷写任务并写入未保存的插件数据改动"""
+    if PluginDataManager._flush_task is not None:
+        PluginDataManager._flush_task.cancel()
+        PluginDataManager._flush_task = None
+    if PluginDataManager._dirty or PluginDataManager._dirty_users:
+        PluginDataManager.write_plugin_data(force=True)
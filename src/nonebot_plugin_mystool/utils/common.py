@@ -36,7 +36,7 @@ from nonebot.log import logger
 from nonebot.log import logger
 from qrcode import QRCode
 
-from ..model import GeetestResult, PluginDataManager, Preference, plugin_config, plugin_env, UserData
+from ..model import GEETEST_JSON_DEFAULT, GeetestResult, PluginDataManager, plugin_config, plugin_env, UserData
 
 __all__ = ["GeneralMessageEvent", "GeneralPrivateMessageEvent", "GeneralGroupMessageEvent", "CommandBegin",
            "get_last_command_sep", "COMMAND_BEGIN", "set_logger", "logger", "PLUGIN", "custom_attempt_times",
@@ -254,7 +254,7 @@ async def get_validate(user: UserData, gt: str = None, challenge: str = None, re
         geetest_url = plugin_config.preference.geetest_url
         params = {"gt": gt, "challenge": challenge}
         params.update(plugin_config.preference.geetest_params or {})
-    content = deepcopy(plugin_config.preference.geetest_json or Preference().geetest_json)
+    content = deepcopy(plugin_config.preference.geetest_json or GEETEST_JSON_DEFAULT)
     for key, value in content.items():
         if isinstance(value, str):
             content[key] = value.format(gt=gt, challenge=challenge)
@@ -405,10 +405,9 @@ def get_unique_users() -> Iterable[Tuple[str, UserData]]:
     """
     获取 不包含绑定用户数据 的所有用户数据以及对应的ID，即不会出现值重复项
 
-    :return: dict_items[用户ID, 用户数据]
+    :return: [(用户ID, 用户数据)]
     """
-    return filter(lambda x: x[0] not in PluginDataManager.plugin_data.user_bind,
-                  PluginDataManager.plugin_data.users.items())
+    return PluginDataManager.get_unique_users()
 
 
 def get_all_bind(user_id: str) -> Iterable[str]: